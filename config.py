@@ -8,6 +8,7 @@ monitored file paths and other user preferences.
 
 import json
 import os
+import stat
 import sys
 from platformdirs import user_config_dir
 
@@ -49,7 +50,8 @@ DEFAULT_CONFIG = {
     "critique_model": "gemini-2.5-pro",
     "critique_prompt": DEFAULT_CRITIQUE_PROMPT,
     "ncbi_email": "",       # Optional: improves rate limits
-    "ncbi_api_key": ""      # Optional: enables 10 req/sec (vs 3 req/sec)
+    "ncbi_api_key": "",     # Optional: enables 10 req/sec (vs 3 req/sec)
+    "log_max_lines": 1000  # Messages kept in the status log; older ones are dropped. 0 keeps all
 }
 
 def load_config():
@@ -91,13 +93,31 @@ def load_config():
 
     return config_to_load
 
+# (serialized config, st_mtime_ns, st_size) of the last successful save
+_last_saved = None
+
 def save_config(config_data):
     """
     Saves the given configuration data to the config file.
+    The write is skipped if the content is unchanged since the last save and the
+    file has not been touched since; otherwise it goes through a temporary file
+    that replaces the config atomically. The config keeps its permissions (new
+    files are private to the user, as they hold API keys), and a symlinked
+    config is written through to its target.
     Returns True on success, False on failure.
     """
-    config_path = get_config_path()
+    global _last_saved
+    config_path = os.path.realpath(get_config_path())
     try:
+        serialized = json.dumps(config_data, indent=4)
+        if _last_saved is not None and _last_saved[0] == serialized:
+            try:
+                st = os.stat(config_path)
+            except OSError:
+                st = None
+            if st is not None and (st.st_mtime_ns, st.st_size) == _last_saved[1:]:
+                return True
+
         config_dir = os.path.dirname(config_path)
         if not os.path.exists(config_dir):
             os.makedirs(config_dir, exist_ok=True)
@@ -106,8 +126,25 @@ def save_config(config_data):
             print(f"Error: Configuration directory is not writable: {config_dir}")
             return False
 
-        with open(config_path, 'w') as f:
-            json.dump(config_data, f, indent=4)
+        try:
+            mode = stat.S_IMODE(os.stat(config_path).st_mode)
+        except OSError:
+            mode = 0o600
+        tmp_path = config_path + ".tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(serialized)
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, config_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        st = os.stat(config_path)
+        _last_saved = (serialized, st.st_mtime_ns, st.st_size)
         return True
     except (IOError, OSError) as e:
         print(f"Error saving configuration: {e}")
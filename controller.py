@@ -7,35 +7,66 @@ the UI (view), the file system monitor, and data processing modules.
 """
 import os
 import logging
-import re
 from PyQt5.QtWidgets import QFileDialog, QMessageBox
 from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot, QThread
-from config import config, save_config
-from file_monitor import FileMonitor
+from config import config
+from file_monitor import FileMonitor, PMID_FILE_RE
 from match_metadata import match_pdf_to_metadata
-from parse_project import extract_metadata_from_project_file, get_summary_for_event, extract_event_data
+from parse_project import (
+    extract_metadata_from_project_file, get_summary_for_event_stream
+)
 from prep_ai_critique import get_pdf_texts_for_pmids, get_ai_critique
 from ui_view import CritiqueWindow
 
 
 class AiCritiqueWorker(QObject):
     """
-    Worker thread for running the AI critique API call without blocking the GUI.
+    Worker thread for preparing the inputs and running the AI critique API call
+    without blocking the GUI.
     """
     finished = pyqtSignal(object)
+    failed = pyqtSignal(str, str)  # (title, message)
+    progress = pyqtSignal(str)
 
-    def __init__(self, summary_text, pdf_data, api_key, model, prompt):
+    def __init__(self, project_file, db_id, lit_items, pdf_folder, api_key, model, prompt):
         super().__init__()
-        self.summary_text = summary_text
-        self.pdf_data = pdf_data
+        self.project_file = project_file
+        self.db_id = db_id
+        self.lit_items = lit_items
+        self.pdf_folder = pdf_folder
         self.api_key = api_key
         self.model = model
         self.prompt = prompt
 
     @pyqtSlot()
     def run(self):
-        """Runs the AI critique and emits the result."""
-        result = get_ai_critique(self.summary_text, self.pdf_data, self.api_key, self.model, self.prompt)
+        """Reads the summary and PDF texts, runs the AI critique and emits the result."""
+        # 1. Get summary text for the selected event
+        try:
+            # Parsed straight from the file instead of reading it into a string first
+            with open(self.project_file, 'rb') as f:
+                summary_text = get_summary_for_event_stream(f, self.db_id)
+        except (IOError, OSError) as e:
+            self.failed.emit("File Error", f"Could not read project file: {e}")
+            return
+
+        if not summary_text:
+            self.failed.emit("Data Error", f"No summary found for DB_ID {self.db_id}")
+            return
+
+        # 2. Get PDF texts
+        try:
+            pdf_data = get_pdf_texts_for_pmids(self.lit_items, self.pdf_folder)
+        except OSError as e:
+            self.failed.emit("PDF Error", f"Could not read the PDF folder: {e}")
+            return
+
+        if not pdf_data:
+            self.failed.emit("PDF Error", "No PDF data could be extracted.")
+            return
+
+        self.progress.emit("Calling Gemini API for critique...")
+        result = get_ai_critique(summary_text, pdf_data, self.api_key, self.model, self.prompt)
         self.finished.emit(result)
 
 
@@ -91,19 +122,12 @@ class Controller(QObject):
         """Shows a warning message box."""
         self.view.show_warning_message(title, message)
 
-    def _save_config(self):
-        if not save_config(config):
-            self.show_directory_warning(
-                "Configuration Error",
-                "Could not save configuration file. Please check permissions for the user config directory."
-            )
-
     def select_downloads_folder(self):
         """Opens a dialog to select the downloads folder."""
         folder = QFileDialog.getExistingDirectory(self.view, "Select Downloads Folder")
         if folder:
             config["downloads_folder"] = folder
-            self._save_config()
+            self.view.schedule_config_save()
             self.view.downloads_button.setText(folder)
             self.status_updated.emit(f"Downloads folder set to: {folder}")
             # Restart the monitor to watch the new folder
@@ -114,10 +138,13 @@ class Controller(QObject):
         folder = QFileDialog.getExistingDirectory(self.view, "Select PDF Folder")
         if folder:
             config["dedicated_pdf_folder"] = folder
-            self._save_config()
+            self.view.schedule_config_save()
             self.view.pdf_folder_button.setText(folder)
             self.status_updated.emit(f"PDF folder set to: {folder}")
             self.file_monitor.update_paths()
+            if self.view.qc_window:
+                self.view.qc_window.rescan_pdf_folder(force=True)
+                self.view.qc_window.refresh_selected_item()
             self.process_existing_pdfs()
 
     def select_project_file(self):
@@ -130,7 +157,7 @@ class Controller(QObject):
         )
         if file:
             config["project_file_path"] = file
-            self._save_config()
+            self.view.schedule_config_save()
             self.view.project_file_button.setText(file)
             self.status_updated.emit(f"Project file set to: {file}")
             # Restart the monitor to watch the new folder
@@ -161,11 +188,12 @@ class Controller(QObject):
             new_filename = f"PMID:{pmid}-{original_filename}"
             new_filepath = os.path.join(directory, new_filename)
 
-            os.rename(file_path, new_filepath)
+            os.replace(file_path, new_filepath)
             logging.info(f"Associated PDF '{original_filename}' with PMID:{pmid}")
 
             # Refresh the QC view
             if self.view.qc_window:
+                self.view.qc_window.mark_pdf_present(pmid, new_filepath)
                 self.view.qc_window.refresh_selected_item()
         except OSError as e:
             error_message = f"Could not rename the file: {e}"
@@ -241,19 +269,9 @@ class Controller(QObject):
             self.metadata_set = extract_metadata_from_project_file(content)
             self.status_updated.emit(f"Successfully loaded {len(self.metadata_set)} metadata entries.")
 
-            # If QC window is open, refresh its data
+            # If QC window is open, refresh its data; parsing runs on the loader thread
             if self.view.qc_window and self.view.qc_window.isVisible():
-                self.status_updated.emit("Project file changed. Refreshing QC view.")
-                event_data = extract_event_data(content)
-                if event_data:
-                    sorted_project_data = sorted(event_data, key=lambda x: x.get('name', 'Unnamed').lower())
-                    self.view.qc_window.update_data(sorted_project_data)
-                    project_file_name = os.path.basename(file_path)
-                    self.view.qc_window.setWindowTitle(f"QC: {project_file_name}")
-                    self.status_updated.emit(f"QC Window updated. Loaded {len(event_data)} items.")
-                else:
-                    self.view.qc_window.update_data([]) # Clear lists
-                    self.status_updated.emit("No data could be extracted from project file, QC view cleared.")
+                self.view.refresh_qc_window(file_path)
 
             self.process_existing_pdfs()
         except (IOError, OSError, Exception) as e:
@@ -270,6 +288,9 @@ class Controller(QObject):
         """
         Handles the event when the PDF folder content changes.
         """
+        if self.view.qc_window:
+            # Keep the cached PDF listing current even while the QC window is hidden
+            self.view.qc_window.rescan_pdf_folder(force=True)
         if self.view.qc_window and self.view.qc_window.isVisible():
             self.status_updated.emit("PDF folder changed. Refreshing QC view.")
             self.view.qc_window.refresh_selected_item()
@@ -309,57 +330,46 @@ class Controller(QObject):
 
         self.status_updated.emit("Starting AI critique preparation...")
 
-        # 1. Get summary text for the selected event
-        selected_items = self.view.qc_window.list_events.selectedItems()
-        if not selected_items:
-            selected_items = self.view.qc_window.list_pathways.selectedItems()
-            if not selected_items:
-                self.show_directory_warning("No item selected in any list.", title="Selection Error")
-                self._reset_critique_state()
-                return
-
-        db_id = selected_items[0].data(0x0100) # UserRole
-        project_file = config.get("project_file_path")
-        try:
-            with open(project_file, 'r', encoding='utf-8') as f:
-                xml_content = f.read()
-        except (IOError, OSError) as e:
-            self.show_directory_warning(f"Could not read project file: {e}", title="File Error")
+        db_id = self.view.qc_window.selected_db_id()
+        if db_id is None:
+            self.show_directory_warning("No item selected in any list.", title="Selection Error")
             self._reset_critique_state()
             return
 
-        summary_text = get_summary_for_event(xml_content, db_id)
-        if not summary_text:
-            self.show_directory_warning(f"No summary found for DB_ID {db_id}", title="Data Error")
-            self._reset_critique_state()
-            return
-
-        # 2. Get PDF texts
-        list_widget = self.view.qc_window.list2
-        items = [list_widget.item(i).text() for i in range(list_widget.count())]
+        project_file = config.get("project_file_path")
+        items = self.view.qc_window.literature_items()
         pdf_folder = config.get("dedicated_pdf_folder")
-        pdf_data = get_pdf_texts_for_pmids(items, pdf_folder)
-
-        if not pdf_data:
-            self.show_directory_warning("No PDF data could be extracted.", title="PDF Error")
-            self._reset_critique_state()
-            return
-
-        self.status_updated.emit("Calling Gemini API for critique...")
         api_key = config.get("GEMINI_API_KEY")
         model = config.get("critique_model", "gemini-2.5-pro")
         prompt = config.get("critique_prompt", "")
 
-        # Setup and start the thread
+        # Setup and start the thread; reading the summary and PDFs happens there too
         self.critique_thread = QThread()
-        self.critique_worker = AiCritiqueWorker(summary_text, pdf_data, api_key, model, prompt)
+        self.critique_worker = AiCritiqueWorker(project_file, db_id, items, pdf_folder, api_key, model, prompt)
         self.critique_worker.moveToThread(self.critique_thread)
         
         self.critique_thread.started.connect(self.critique_worker.run)
         self.critique_worker.finished.connect(self.on_ai_critique_finished)
+        self.critique_worker.failed.connect(self.on_ai_critique_failed)
+        self.critique_worker.progress.connect(self.status_updated.emit)
         
         self.critique_thread.start()
 
+    def _finish_critique_thread(self):
+        """Stops the critique worker thread and drops the references to it."""
+        self.critique_thread.quit()
+        self.critique_thread.wait()
+        self.critique_thread = None
+        self.critique_worker = None
+
+    def on_ai_critique_failed(self, title, message):
+        """
+        Handles a critique that could not be prepared by the worker thread.
+        """
+        self._finish_critique_thread()
+        self.show_directory_warning(message, title=title)
+        self._reset_critique_state()
+
     def on_ai_critique_finished(self, critique_result):
         """
         Handles the result from the AI critique worker thread.
@@ -374,10 +384,7 @@ class Controller(QObject):
         self.status_updated.emit("Critique window closed.")
 
         # Clean up the thread
-        self.critique_thread.quit()
-        self.critique_thread.wait()
-        self.critique_thread = None
-        self.critique_worker = None
+        self._finish_critique_thread()
 
         # Update button state by refreshing the view
         self.view.qc_window.is_critique_running = False
@@ -391,20 +398,8 @@ class Controller(QObject):
         if not self.view.qc_window:
             return
 
-        # Extract PMIDs from literature list (list2)
-        list_widget = self.view.qc_window.list2
-        items = [list_widget.item(i).text() for i in range(list_widget.count())]
-
-        pmids = []
-        for item_text in items:
-            # Parse PMID from format: "✓ 12345678 Smith (2020): Title"
-            # PMID is the second space-separated token
-            match = re.search(r'\s(\d{6,})\s', item_text)
-            if match:
-                pmid = match.group(1)
-                # Skip if already has PDF (starts with ✓)
-                if not item_text.startswith('✓'):
-                    pmids.append(pmid)
+        # PMIDs from the literature list (list2) that don't have a PDF yet
+        pmids = self.view.qc_window.missing_pdf_pmids()
 
         if not pmids:
             QMessageBox.information(
@@ -500,7 +495,7 @@ class Controller(QObject):
         self.status_updated.emit(f"Processing PDFs in {pdf_folder}...")
         for filename in os.listdir(pdf_folder):
             if filename.lower().endswith(".pdf"):
-                if re.match(r'PMID:\d+', filename):
+                if PMID_FILE_RE.match(filename):
                     # Ignoring PDF with PMID in filename
                     continue
                 pdf_path = os.path.join(pdf_folder, filename)
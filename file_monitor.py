@@ -19,6 +19,10 @@ from config import config
 
 logger = logging.getLogger(__name__)
 
+# Files already renamed by the app start with "PMID:<digits>", e.g.
+# "PMID:12345678-paper.pdf"; group 1 is the PMID
+PMID_FILE_RE = re.compile(r'PMID:(\d+)')
+
 def check_directory(path):
     """
     Checks if a directory exists and is accessible (readable and writable).
@@ -134,7 +138,7 @@ class EventHandler(FileSystemEventHandler, QObject):
 
             try:
                 file_name = os.path.basename(src_path)
-                if re.match(r'PMID:\d+', file_name):
+                if PMID_FILE_RE.match(file_name):
                     return
 
                 destination_path = os.path.join(self.pdf_folder, file_name)
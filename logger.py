@@ -7,6 +7,7 @@ Provides a centralized way to log application events and handle errors gracefull
 
 import logging
 import os
+from collections import deque
 from PyQt5.QtCore import QObject, pyqtSignal
 
 LOG_DIR = "logs"
@@ -14,20 +15,41 @@ LOG_FILE = os.path.join(LOG_DIR, "application.log")
 
 class QLogHandler(QObject, logging.Handler):
     """
-    A custom logging handler that emits a PyQt signal for each log record.
+    A custom logging handler that hands log records to the UI thread.
+
+    Records may be logged from any thread. Each one is queued as a
+    (formatted message, level number) pair, and records_ready is emitted only
+    for the first record after the last take_records call, so a burst of
+    records costs a single queued signal. The receiver collects the pairs with
+    take_records.
     """
-    log_emitted = pyqtSignal(str)
+    records_ready = pyqtSignal()
 
     def __init__(self):
         QObject.__init__(self)
         logging.Handler.__init__(self)
+        self._pending = deque()
+        self._notified = False
 
     def emit(self, record):
         """
-        Emits the formatted log record as a signal.
+        Queues the formatted log record; called with the handler lock held.
         """
         msg = self.format(record)
-        self.log_emitted.emit(msg)
+        self._pending.append((msg, record.levelno))
+        if not self._notified:
+            self._notified = True
+            self.records_ready.emit()
+
+    def take_records(self):
+        """
+        Returns and removes all queued (message, level number) pairs.
+        """
+        with self.lock:
+            records = list(self._pending)
+            self._pending.clear()
+            self._notified = False
+        return records
 
 def setup_logger(debug=False):
     """
@@ -23,6 +23,7 @@ warnings.filterwarnings(
 )
 
 from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import Qt
 from ui_view import MainAppWindow
 from controller import Controller
 from logger import setup_logger, QLogHandler
@@ -66,8 +67,14 @@ def main():
     controller = Controller(main_window, log_handler)
     main_window.set_controller(controller)
 
-    # Connect the log handler to the UI
-    log_handler.log_emitted.connect(main_window.update_status_display)
+    # Connect the log handler to the UI; queued, so records from worker
+    # threads are always shown from the GUI thread
+    def show_log_records():
+        main_window.add_log_records(log_handler.take_records())
+
+    log_handler.records_ready.connect(show_log_records, Qt.QueuedConnection)
+    # Show what was logged while the window and controller were being set up
+    show_log_records()
 
     # Show the main window
     main_window.show()
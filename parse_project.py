@@ -1,6 +1,10 @@
+import io
 import logging
+from operator import itemgetter
 import xml.etree.ElementTree as ET
 
+EVENT_OBJECT_TYPES = ('Pathway', 'BlackBoxEvent', 'FailedReaction', 'Polymerisation', 'Reaction')
+
 
 def extract_metadata_from_project_file(xml_string):
     """
@@ -58,116 +62,124 @@ def extract_event_data(xml_string):
     Returns:
         A list of unique dictionaries, where each dictionary contains data for an object.
         The dictionary keys are 'DB_ID', 'name', 'summation_text', and 'literature_references'.
+        '_db_id_str' keeps the DB_ID as it appeared in the XML, matching 'hasEvent_refs'.
         'literature_references' is a list of lists, with each inner list containing
         [pubMedIdentifier, title, year, [author_surnames]].
     """
-    try:
-        root = ET.fromstring(xml_string)
-    except ET.ParseError as e:
-        logging.error(f"Error parsing XML: {e}")
-        return []
-
-    summations = {}
-    for summation_instance in root.findall('.//Summation/instance'):
-        db_id = summation_instance.get('DB_ID')
-        if not db_id:
-            continue
-        text_attr = summation_instance.find("attribute[@name='text']")
-        if text_attr is not None and text_attr.get('value') is not None:
-            summations[db_id] = text_attr.get('value')
-
-    persons = {}
-    for person_instance in root.findall('.//Person/instance'):
-        db_id = person_instance.get('DB_ID')
-        if not db_id:
-            continue
-
-        surname = None
-        # For non-shell instances, surname is an attribute
-        surname_attr = person_instance.find("attribute[@name='surname']")
-        if surname_attr is not None:
-            surname = surname_attr.get('value')
-
-        # For shell instances, it's in the displayName
-        if not surname:
-            display_name = person_instance.get('displayName')
-            if display_name:
-                surname = display_name.split(',')[0].strip()
-
-        if surname:
-            persons[db_id] = surname
-
-    literature_refs = {}
-    for lit_ref_instance in root.findall('.//LiteratureReference/instance'):
-        db_id = lit_ref_instance.get('DB_ID')
-        if not db_id:
-            continue
+    return extract_event_data_stream(io.StringIO(xml_string))
 
-        title_attr = lit_ref_instance.find("attribute[@name='title']")
-        pubmed_attr = lit_ref_instance.find("attribute[@name='pubMedIdentifier']")
-        year_attr = lit_ref_instance.find("attribute[@name='year']")
 
-        title = title_attr.get('value') if title_attr is not None else None
-        pubmed_id = pubmed_attr.get('value') if pubmed_attr is not None else None
-        year = year_attr.get('value') if year_attr is not None else None
+def extract_event_data_stream(source):
+    """
+    Streaming variant of extract_event_data that reads the project file incrementally.
 
-        authors = []
-        for author_attr in lit_ref_instance.findall("attribute[@name='author']"):
-            author_id = author_attr.get('referTo')
-            if author_id in persons:
-                authors.append(persons[author_id])
+    Each instance element is detached from its parent as soon as it has been
+    consumed, so memory use is bounded by the extracted data rather than by the
+    size of the XML document.
+    References between instances are collected as IDs and resolved once the whole
+    document has been read, since they may point forward in the file.
 
-        if title and pubmed_id:
-            literature_refs[db_id] = [pubmed_id, title, year, authors]
+    Args:
+        source: A file name or a file object (preferably opened in binary mode).
 
-    results = []
-    object_types = ['Pathway', 'BlackBoxEvent', 'FailedReaction', 'Polymerisation', 'Reaction']
+    Returns:
+        The same list of dictionaries as extract_event_data.
+    """
+    summations = {}
+    summation_lit_refs = {}
+    persons = {}
+    literature_refs = {}
+    events = {obj_type: [] for obj_type in EVENT_OBJECT_TYPES}
 
-    for obj_type in object_types:
-        for instance in root.findall(f'.//{obj_type}/instance'):
-            if instance.get('isShell') == 'true':
+    # Open elements; the last one is the parent of the element that just ended
+    open_elems = []
+    try:
+        for event, elem in ET.iterparse(source, events=('start', 'end')):
+            if event == 'start':
+                open_elems.append(elem)
+                continue
+            open_elems.pop()
+            if elem.tag != 'instance' or not open_elems:
                 continue
 
-            db_id = instance.get('DB_ID')
-            name_attr = instance.find("attribute[@name='name']")
+            parent_elem = open_elems[-1]
+            parent = parent_elem.tag
+            db_id = elem.get('DB_ID')
+
+            if parent == 'Summation':
+                if db_id:
+                    text_attr = elem.find("attribute[@name='text']")
+                    if text_attr is not None and text_attr.get('value') is not None:
+                        summations[db_id] = text_attr.get('value')
+                    summation_lit_refs.setdefault(
+                        db_id,
+                        [a.get('referTo') for a in elem.findall("attribute[@name='literatureReference']")]
+                    )
+
+            elif parent == 'Person':
+                if db_id:
+                    surname = None
+                    # For non-shell instances, surname is an attribute
+                    surname_attr = elem.find("attribute[@name='surname']")
+                    if surname_attr is not None:
+                        surname = surname_attr.get('value')
+
+                    # For shell instances, it's in the displayName
+                    if not surname:
+                        display_name = elem.get('displayName')
+                        if display_name:
+                            surname = display_name.split(',')[0].strip()
+
+                    if surname:
+                        persons[db_id] = surname
+
+            elif parent == 'LiteratureReference':
+                if db_id:
+                    title_attr = elem.find("attribute[@name='title']")
+                    pubmed_attr = elem.find("attribute[@name='pubMedIdentifier']")
+                    year_attr = elem.find("attribute[@name='year']")
+
+                    title = title_attr.get('value') if title_attr is not None else None
+                    pubmed_id = pubmed_attr.get('value') if pubmed_attr is not None else None
+                    year = year_attr.get('value') if year_attr is not None else None
+
+                    # Author IDs are resolved to surnames after parsing
+                    author_ids = [a.get('referTo') for a in elem.findall("attribute[@name='author']")]
+
+                    if title and pubmed_id:
+                        literature_refs[db_id] = [pubmed_id, title, year, author_ids]
+
+            elif parent in events:
+                name_attr = elem.find("attribute[@name='name']")
+                if elem.get('isShell') != 'true' and db_id and name_attr is not None:
+                    summation_attr = elem.find("attribute[@name='summation']")
+                    summation_id = summation_attr.get('referTo') if summation_attr is not None else None
+                    lit_ref_ids = [a.get('referTo') for a in elem.findall("attribute[@name='literatureReference']")]
+                    has_event_refs = []
+                    if parent == 'Pathway':
+                        for event_attr in elem.findall("attribute[@name='hasEvent']"):
+                            event_id = event_attr.get('referTo')
+                            if event_id:
+                                has_event_refs.append(event_id)
+                    events[parent].append((db_id, name_attr.get('value'), summation_id, lit_ref_ids, has_event_refs))
+
+            parent_elem.remove(elem)
+    except ET.ParseError as e:
+        logging.error(f"Error parsing XML: {e}")
+        return []
 
-            if not db_id or name_attr is None:
-                continue
+    for ref in literature_refs.values():
+        ref[3] = [persons[author_id] for author_id in ref[3] if author_id in persons]
+
+    results = []
+    for obj_type in EVENT_OBJECT_TYPES:
+        for db_id, name, summation_id, lit_ref_ids, has_event_refs in events[obj_type]:
+            summation_text = summations.get(summation_id) if summation_id else None
 
-            name = name_attr.get('value')
-
-            summation_text = None
-            summation_id = None
-            summation_attr = instance.find("attribute[@name='summation']")
-            if summation_attr is not None:
-                summation_id = summation_attr.get('referTo')
-                if summation_id in summations:
-                    summation_text = summations[summation_id]
-
-            lit_ref_list = []
-            # Get literature references directly from the entity
-            for lit_ref_attr in instance.findall("attribute[@name='literatureReference']"):
-                lit_ref_id = lit_ref_attr.get('referTo')
-                if lit_ref_id in literature_refs:
-                    lit_ref_list.append(literature_refs[lit_ref_id])
-            
-            # Also get literature references from the summation element
+            # Literature references from the entity itself, then from its summation
             if summation_id:
-                # Find the summation instance in the XML
-                summation_instance = root.find(f".//Summation/instance[@DB_ID='{summation_id}']")
-                if summation_instance is not None:
-                    # Get literature references from the summation
-                    for lit_ref_attr in summation_instance.findall("attribute[@name='literatureReference']"):
-                        lit_ref_id = lit_ref_attr.get('referTo')
-                        if lit_ref_id in literature_refs:
-                            lit_ref_list.append(literature_refs[lit_ref_id])
-
-            has_event_refs = []
-            if obj_type == 'Pathway':
-                for event_attr in instance.findall("attribute[@name='hasEvent']"):
-                    event_id = event_attr.get('referTo')
-                    if event_id:
-                        has_event_refs.append(event_id)
+                lit_ref_ids = lit_ref_ids + summation_lit_refs.get(summation_id, [])
+            lit_ref_list = [literature_refs[ref_id] for ref_id in lit_ref_ids if ref_id in literature_refs]
 
             try:
                 db_id_int = int(db_id)
@@ -176,6 +188,7 @@ def extract_event_data(xml_string):
 
             results.append({
                 'DB_ID': db_id_int,
+                '_db_id_str': db_id,
                 'name': name,
                 'summation_text': summation_text,
                 'literature_references': lit_ref_list,
@@ -188,6 +201,26 @@ def extract_event_data(xml_string):
     return list(unique_results)
 
 
+def sort_event_data(event_data):
+    """
+    Sorts event data in place alphabetically by name (case-insensitive).
+
+    The casefolded name is computed once per item and stored under '_sort_key',
+    so the sort itself only compares ready-made keys. The sort is stable, so
+    items with equal names keep their order and the dicts are never compared.
+
+    Args:
+        event_data (list): Dictionaries as returned by extract_event_data.
+
+    Returns:
+        list: The same list, sorted.
+    """
+    for d in event_data:
+        d['_sort_key'] = (d.get('name') or 'Unnamed').casefold()
+    event_data.sort(key=itemgetter('_sort_key'))
+    return event_data
+
+
 def get_summary_for_event(xml_string, db_id):
     """
     Finds the summary text for a specific event DB_ID in the XML data.
@@ -199,7 +232,21 @@ def get_summary_for_event(xml_string, db_id):
     Returns:
         str: The summation text for the given event, or None if not found.
     """
-    event_data = extract_event_data(xml_string)
+    return get_summary_for_event_stream(io.StringIO(xml_string), db_id)
+
+
+def get_summary_for_event_stream(source, db_id):
+    """
+    Streaming variant of get_summary_for_event that reads the project file incrementally.
+
+    Args:
+        source: A file name or a file object (preferably opened in binary mode).
+        db_id (int or str): The DB_ID of the event to find.
+
+    Returns:
+        str: The summation text for the given event, or None if not found.
+    """
+    event_data = extract_event_data_stream(source)
     target_db_id = int(db_id)
 
     for event in event_data:
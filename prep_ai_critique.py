@@ -6,6 +6,7 @@ from google import genai
 from google.genai import types
 from pydantic import BaseModel
 
+from file_monitor import PMID_FILE_RE
 from logger import setup_logger
 
 logger = setup_logger()
@@ -103,41 +104,47 @@ def get_pdf_texts_for_pmids(qc_list_items, pdf_folder):
     if not pmids:
         return {}
 
+    # Map each PMID to its PDF with a single directory scan
+    pdf_files = {}
+    with os.scandir(pdf_folder) as entries:
+        for entry in entries:
+            match = PMID_FILE_RE.match(entry.name)
+            if match and entry.name.lower().endswith('.pdf') and entry.is_file():
+                pdf_files.setdefault(match.group(1), entry.name)
+
     # Find PDF for each PMID and extract text
     for pmid in pmids:
-        found_pdf = False
-        for filename in os.listdir(pdf_folder):
-            if filename.startswith(f"PMID:{pmid}") and filename.lower().endswith('.pdf'):
-                pdf_path = os.path.join(pdf_folder, filename)
-                txt_path = os.path.splitext(pdf_path)[0] + '.txt'
-
-                text = ""
-                # Try to read from .txt file first
-                if os.path.exists(txt_path):
-                    try:
-                        with open(txt_path, 'r', encoding='utf-8') as f:
-                            text = f.read()
-                        logger.info(f"Successfully extracted text from {os.path.basename(txt_path)} for PMID {pmid}.")
-                    except Exception as e:
-                        logger.error(f"Error reading TXT file {os.path.basename(txt_path)} for PMID {pmid}: {e}")
-                        text = None
-                # Fallback to PDF extraction
-                else:
-                    try:
-                        with fitz.open(pdf_path) as doc:
-                            for page in doc:
-                                text += page.get_text()
-                            logger.info(f"Successfully extracted text from {filename} for PMID {pmid}.")
-                    except Exception as e:
-                        # Handle cases where PDF is corrupt or can't be read
-                        logger.error(f"Error reading PDF {filename} for PMID {pmid}: {e}")
-                        text = None
-                
-                pmid_texts[pmid] = text
-                found_pdf = True
-                break
-        if not found_pdf:
+        filename = pdf_files.get(pmid)
+        if filename is None:
             logger.warning(f"PDF file not found for PMID {pmid}.")
             pmid_texts[pmid] = None
+            continue
+
+        pdf_path = os.path.join(pdf_folder, filename)
+        txt_path = os.path.splitext(pdf_path)[0] + '.txt'
+
+        text = ""
+        # Try to read from .txt file first
+        if os.path.exists(txt_path):
+            try:
+                with open(txt_path, 'r', encoding='utf-8') as f:
+                    text = f.read()
+                logger.info(f"Successfully extracted text from {os.path.basename(txt_path)} for PMID {pmid}.")
+            except Exception as e:
+                logger.error(f"Error reading TXT file {os.path.basename(txt_path)} for PMID {pmid}: {e}")
+                text = None
+        # Fallback to PDF extraction
+        else:
+            try:
+                with fitz.open(pdf_path) as doc:
+                    for page in doc:
+                        text += page.get_text()
+                    logger.info(f"Successfully extracted text from {filename} for PMID {pmid}.")
+            except Exception as e:
+                # Handle cases where PDF is corrupt or can't be read
+                logger.error(f"Error reading PDF {filename} for PMID {pmid}: {e}")
+                text = None
+
+        pmid_texts[pmid] = text
 
     return pmid_texts
@@ -8,18 +8,306 @@ built with PyQt5.
 
 import sys
 import os
+import logging
 import webbrowser
+from collections import OrderedDict, deque
+from contextlib import contextmanager
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QTextEdit, QStatusBar, QSplitter,
-    QSizePolicy, QRadioButton, QButtonGroup, QMessageBox, QListWidget, QListWidgetItem,
-    QDialog, QFileDialog, QInputDialog, QLineEdit, QPlainTextEdit, QDialogButtonBox, QTabWidget
+    QPushButton, QLabel, QStatusBar, QSplitter,
+    QSizePolicy, QRadioButton, QButtonGroup, QMessageBox, QListView, QListWidget,
+    QDialog, QFileDialog, QInputDialog, QLineEdit, QPlainTextEdit, QDialogButtonBox, QTabWidget,
+    QStyle, QStyledItemDelegate, QStyleOptionViewItem
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+from PyQt5.QtCore import (
+    Qt, QAbstractListModel, QEvent, QModelIndex, QObject, QSize, QThread, QTimer, pyqtSignal, pyqtSlot
+)
+from PyQt5.QtGui import QFontDatabase
 from config import config, save_config
-from parse_project import extract_event_data
+from file_monitor import PMID_FILE_RE
+from parse_project import extract_event_data_stream, sort_event_data
 from prep_ai_critique import CritiqueResult
 
+_NOT_SET = sys.intern("Not Set")
+
+# Longer messages are cut short in the status bar
+_STATUS_BAR_MAX_CHARS = 200
+# Longer messages are cropped in the status log; the log file keeps them in full
+_STATUS_LOG_MAX_CHARS = 4096
+
+
+@contextmanager
+def _batch_update(list_widget):
+    """Suspends repaints and signals of a list widget while it is repopulated."""
+    list_widget.setUpdatesEnabled(False)
+    list_widget.blockSignals(True)
+    try:
+        yield list_widget
+    finally:
+        list_widget.blockSignals(False)
+        list_widget.setUpdatesEnabled(True)
+
+
+def _fill_list(list_widget, rows):
+    """
+    Replaces the rows of a list widget with (text, user_data) pairs.
+
+    Existing QListWidgetItems are reused in place and only the difference in
+    row count is allocated or removed, instead of clearing and rebuilding them all.
+    """
+    n_new = len(rows)
+    n_old = list_widget.count()
+    with _batch_update(list_widget):
+        list_widget.clearSelection()
+        list_widget.setCurrentRow(-1)
+        for i in range(min(n_new, n_old)):
+            text, data = rows[i]
+            list_item = list_widget.item(i)
+            list_item.setText(text)
+            list_item.setData(Qt.UserRole, data)
+        if n_new > n_old:
+            # One row insertion for all new rows, then attach their data
+            list_widget.addItems([text for text, _ in rows[n_old:]])
+            for i in range(n_old, n_new):
+                list_widget.item(i).setData(Qt.UserRole, rows[i][1])
+        for _ in range(n_old - n_new):
+            list_widget.takeItem(list_widget.count() - 1)
+
+
+class LitModel(QAbstractListModel):
+    """
+    List model backing the literature reference list of the QC window.
+
+    Rows are kept in parallel lists indexed by row: the display strings (also
+    used as tooltips), the PMIDs and the column tuples. For message rows pmid and columns are None;
+    otherwise columns is (check_mark, pmid, surname, year, title) and is exposed
+    under COLUMNS_ROLE for LitDelegate.
+    """
+    COLUMNS_ROLE = Qt.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._texts = []
+        self._pmids = []
+        self._columns = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._texts)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return self._texts[index.row()]
+        if role == Qt.UserRole:
+            return self._pmids[index.row()]
+        if role == self.COLUMNS_ROLE:
+            return self._columns[index.row()]
+        return None
+
+    def set_rows(self, texts, pmids=None, columns=None):
+        """
+        Replaces all rows with a single model reset. Without pmids and columns the
+        rows are message rows.
+        """
+        if not texts and not self._texts:
+            return
+        self.beginResetModel()
+        self._texts = texts
+        self._pmids = pmids if pmids is not None else [None] * len(texts)
+        self._columns = columns if columns is not None else [None] * len(texts)
+        self.endResetModel()
+
+    def texts(self):
+        return self._texts
+
+    def pmids(self):
+        return self._pmids
+
+    def columns(self):
+        return self._columns
+
+    def pmid_at(self, row):
+        return self._pmids[row]
+
+
+class LitDelegate(QStyledItemDelegate):
+    """
+    Paints literature rows straight from the model's column tuples.
+
+    The check mark, PMID (monospace), first author, year and title are drawn at
+    x-offsets that are fitted to the widest entries each time the model is
+    reset, so the title gets all the remaining width. Long surnames are elided
+    at a fixed maximum width. Message rows fall back to the default painting of
+    their display string.
+    """
+    def __init__(self, parent, model):
+        super().__init__(parent)
+        self._model = model
+        self._mono = QFontDatabase.systemFont(QFontDatabase.FixedFont)
+        # Fitted on the next paint, with the painter's metrics
+        self._columns = None
+        model.modelReset.connect(self._invalidate_columns)
+
+    def _invalidate_columns(self):
+        self._columns = None
+
+    def _fit_columns(self, fm, mono_fm):
+        """Computes the left edge and width of each column from the model's rows."""
+        pmid_w = surname_w = year_w = 0
+        for columns in self._model.columns():
+            if columns is None:
+                continue
+            _, pmid, surname, year, _ = columns
+            pmid_w = max(pmid_w, mono_fm.horizontalAdvance(pmid))
+            surname_w = max(surname_w, fm.horizontalAdvance(surname))
+            year_w = max(year_w, fm.horizontalAdvance(f"({year}):"))
+        surname_w = min(surname_w, fm.averageCharWidth() * 12)
+        gap = fm.horizontalAdvance(" ")
+        x = 4
+        self._columns = []
+        for width in (fm.horizontalAdvance("❌"), pmid_w, surname_w, year_w):
+            # elidedText already elides text that is exactly as wide as the column
+            width += 1
+            self._columns.append((x, width))
+            x += width + gap
+        # The title takes the remaining width
+        self._title_x = x
+
+    def paint(self, painter, option, index):
+        columns = index.data(LitModel.COLUMNS_ROLE)
+        if columns is None:
+            super().paint(painter, option, index)
+            return
+
+        # Let the style draw background, selection and focus, but no text
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+
+        check_mark, pmid, surname, year, title = columns
+        rect = option.rect
+        painter.save()
+        if self._columns is None:
+            painter.setFont(self._mono)
+            mono_fm = painter.fontMetrics()
+            painter.setFont(option.font)
+            self._fit_columns(painter.fontMetrics(), mono_fm)
+        if option.state & QStyle.State_Selected:
+            painter.setPen(option.palette.highlightedText().color())
+        else:
+            painter.setPen(option.palette.text().color())
+        flags = Qt.AlignLeft | Qt.AlignVCenter
+        texts = (check_mark, pmid, surname, f"({year}):")
+        for col, ((x, width), text) in enumerate(zip(self._columns, texts)):
+            painter.setFont(self._mono if col == 1 else option.font)
+            fm = painter.fontMetrics()
+            painter.drawText(rect.left() + x, rect.top(), width, rect.height(), flags,
+                             fm.elidedText(text, Qt.ElideRight, width))
+        painter.setFont(option.font)
+        title_w = max(0, rect.width() - self._title_x)
+        painter.drawText(rect.left() + self._title_x, rect.top(), title_w, rect.height(), flags,
+                         painter.fontMetrics().elidedText(title, Qt.ElideRight, title_w))
+        painter.restore()
+
+
+class LogListModel(QAbstractListModel):
+    """
+    List model backing the status log, one row per message.
+
+    Lines are kept in a deque bounded by max_lines (None keeps every line);
+    once it is full, appending drops the oldest rows. Only the added and
+    dropped rows are signalled to the view.
+    """
+    def __init__(self, max_lines, parent=None):
+        super().__init__(parent)
+        self._lines = deque(maxlen=max_lines)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._lines)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return self._lines[index.row()]
+        return None
+
+    def max_lines(self):
+        return self._lines.maxlen
+
+    def append_lines(self, lines):
+        """Appends the given lines, dropping the oldest ones beyond max_lines."""
+        maxlen = self._lines.maxlen
+        if maxlen is not None and len(lines) > maxlen:
+            lines = lines[-maxlen:]
+        if not lines:
+            return
+        overflow = 0 if maxlen is None else len(self._lines) + len(lines) - maxlen
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            for _ in range(overflow):
+                self._lines.popleft()
+            self.endRemoveRows()
+        first = len(self._lines)
+        self.beginInsertRows(QModelIndex(), first, first + len(lines) - 1)
+        self._lines.extend(lines)
+        self.endInsertRows()
+
+
+class ProjectLoader(QObject):
+    """
+    Worker for reading, parsing and sorting the project file without blocking the GUI.
+    """
+    loaded = pyqtSignal(list)
+    failed = pyqtSignal(str, str)  # (title, message)
+
+    def __init__(self, project_file_path, cache_key, refresh=False):
+        super().__init__()
+        self.project_file_path = project_file_path
+        self.cache_key = cache_key
+        self.refresh = refresh  # Reloading the open QC window after a file change
+
+    @pyqtSlot()
+    def run(self):
+        """Parses the project file and emits the event data sorted by name."""
+        try:
+            with open(self.project_file_path, 'rb') as f:
+                event_data = extract_event_data_stream(f)
+        except FileNotFoundError:
+            self.failed.emit("Project File Error", f"Project file not found at: {self.project_file_path}")
+            return
+        except Exception as e:
+            self.failed.emit("File Read Error", f"Could not read project file: {e}")
+            return
+
+        self.loaded.emit(sort_event_data(event_data))
+
+
+def _titled(title, widget):
+    """Returns a container showing a title label above the given widget."""
+    container = QWidget()
+    layout = QVBoxLayout(container)
+    layout.setContentsMargins(0, 0, 0, 0)
+    layout.setSpacing(2)
+    layout.addWidget(QLabel(title))
+    layout.addWidget(widget)
+    return container
+
+
+def _read_only_text(text=""):
+    """
+    Returns a read-only QPlainTextEdit showing the given plain text.
+
+    QPlainTextEdit lays out large plain text much faster than QTextEdit.
+    """
+    text_view = QPlainTextEdit()
+    text_view.setReadOnly(True)
+    text_view.setPlainText(text)
+    return text_view
+
 
 class CritiqueWindow(QDialog):
     """
@@ -27,6 +315,7 @@ class CritiqueWindow(QDialog):
     """
     def __init__(self, result, parent=None):
         super().__init__(parent)
+        self.setAttribute(Qt.WA_DeleteOnClose, True)
         self.setWindowTitle("AI Critique Result")
         self.setGeometry(200, 200, 700, 540)
 
@@ -36,15 +325,13 @@ class CritiqueWindow(QDialog):
         if isinstance(result, CritiqueResult):
             # Critique
             critique_label = QLabel("Critique:")
-            self.critique_text = QTextEdit(result.Critique)
-            self.critique_text.setReadOnly(True)
+            self.critique_text = _read_only_text(result.Critique)
             splitter.addWidget(critique_label)
             splitter.addWidget(self.critique_text)
 
             # Summary of Critique
             summary_label = QLabel("Summary of Critique:")
-            self.summary_text = QTextEdit(result.SummaryOfCritique)
-            self.summary_text.setReadOnly(True)
+            self.summary_text = _read_only_text(result.SummaryOfCritique)
             splitter.addWidget(summary_label)
             splitter.addWidget(self.summary_text)
 
@@ -57,8 +344,7 @@ class CritiqueWindow(QDialog):
             improved_layout = QHBoxLayout(improved_container)
             improved_layout.setContentsMargins(0, 0, 0, 0)
 
-            self.improved_text = QTextEdit(result.ImprovedShortText)
-            self.improved_text.setReadOnly(True)
+            self.improved_text = _read_only_text(result.ImprovedShortText)
             improved_layout.addWidget(self.improved_text)
 
             # Copy button for improved text
@@ -72,8 +358,7 @@ class CritiqueWindow(QDialog):
 
         else: # Handle error case
             error_label = QLabel("An error occurred:")
-            self.error_text = QTextEdit(str(result))
-            self.error_text.setReadOnly(True)
+            self.error_text = _read_only_text(str(result))
             splitter.addWidget(error_label)
             splitter.addWidget(self.error_text)
 
@@ -110,51 +395,40 @@ class PmcDownloadResultDialog(QDialog):
             summary_label = QLabel(f"<b>{summary_text}</b>")
             layout.addWidget(summary_label)
 
-            # Create tabbed text areas for different result categories
-            tab_widget = QTabWidget()
-
-            # Tab 1: Successfully Downloaded
+            # Tab texts for the different result categories; the text views are
+            # only created when their tab is first shown
+            tabs = []
             if result.downloaded_files:
-                success_text = QTextEdit()
-                success_text.setReadOnly(True)
-                success_content = "\n".join(result.downloaded_files)
-                success_text.setPlainText(success_content)
-                tab_widget.addTab(success_text, f"Downloaded ({len(result.downloaded_files)})")
-
-            # Tab 2: Not Available in PMC
+                tabs.append((f"Downloaded ({len(result.downloaded_files)})",
+                             "\n".join(result.downloaded_files)))
             if result.not_available_in_pmc:
-                not_in_pmc_text = QTextEdit()
-                not_in_pmc_text.setReadOnly(True)
-                content = "The following PMIDs are not available in PubMed Central:\n\n"
-                content += "\n".join(result.not_available_in_pmc)
-                not_in_pmc_text.setPlainText(content)
-                tab_widget.addTab(not_in_pmc_text, f"Not in PMC ({len(result.not_available_in_pmc)})")
-
-            # Tab 3: No PDF Available
+                content = "\n".join(["The following PMIDs are not available in PubMed Central:", "",
+                                     *result.not_available_in_pmc])
+                tabs.append((f"Not in PMC ({len(result.not_available_in_pmc)})", content))
             if result.no_pdf_available:
-                no_pdf_text = QTextEdit()
-                no_pdf_text.setReadOnly(True)
-                content = "The following PMIDs are in PMC but have no PDF in the Open Access subset:\n\n"
-                content += "\n".join(result.no_pdf_available)
-                no_pdf_text.setPlainText(content)
-                tab_widget.addTab(no_pdf_text, f"No PDF ({len(result.no_pdf_available)})")
-
-            # Tab 4: Errors
+                content = "\n".join(["The following PMIDs are in PMC but have no PDF in the Open Access subset:", "",
+                                     *result.no_pdf_available])
+                tabs.append((f"No PDF ({len(result.no_pdf_available)})", content))
             if result.errors:
-                errors_text = QTextEdit()
-                errors_text.setReadOnly(True)
-                content = "Errors occurred for the following PMIDs:\n\n"
-                for pmid, error_msg in result.errors.items():
-                    content += f"PMID {pmid}: {error_msg}\n"
-                errors_text.setPlainText(content)
-                tab_widget.addTab(errors_text, f"Errors ({len(result.errors)})")
+                parts = ["Errors occurred for the following PMIDs:", ""]
+                parts.extend(f"PMID {pmid}: {error_msg}" for pmid, error_msg in result.errors.items())
+                content = "\n".join(parts)
+                tabs.append((f"Errors ({len(result.errors)})", content))
+
+            self._tab_content = [content for _, content in tabs]
+            tab_widget = QTabWidget()
+            self._tab_widget = tab_widget
+            tab_widget.currentChanged.connect(self._materialize_tab)
+            for label, _ in tabs:
+                placeholder = QWidget()
+                QVBoxLayout(placeholder).setContentsMargins(0, 0, 0, 0)
+                tab_widget.addTab(placeholder, label)
 
             layout.addWidget(tab_widget)
 
         else:  # Handle error case
             error_label = QLabel("An error occurred:")
-            error_text = QTextEdit(str(result))
-            error_text.setReadOnly(True)
+            error_text = _read_only_text(str(result))
             layout.addWidget(error_label)
             layout.addWidget(error_text)
 
@@ -163,6 +437,13 @@ class PmcDownloadResultDialog(QDialog):
         ok_button.clicked.connect(self.accept)
         layout.addWidget(ok_button)
 
+    def _materialize_tab(self, idx):
+        """Creates the text view of a result tab the first time it is shown."""
+        if idx < 0 or self._tab_content[idx] is None:
+            return
+        self._tab_widget.widget(idx).layout().addWidget(_read_only_text(self._tab_content[idx]))
+        self._tab_content[idx] = None
+
 
 class PromptEditorDialog(QDialog):
     """
@@ -200,12 +481,10 @@ class PromptEditorDialog(QDialog):
 class ActionPopup(QDialog):
     def __init__(self, pmid, parent=None):
         super().__init__(parent)
-        self.setWindowTitle(f"Action for PMID: {pmid}")
-        self.pmid = pmid
 
         layout = QVBoxLayout(self)
         
-        self.label = QLabel(f"What would you like to do with PMID: {pmid}?")
+        self.label = QLabel()
         layout.addWidget(self.label)
 
         self.btn_open_browser = QPushButton("Open PMID in browser")
@@ -229,31 +508,69 @@ class ActionPopup(QDialog):
         self.btn_download_from_pmc.clicked.connect(lambda: self.done(4))
         self.btn_cancel.clicked.connect(self.reject)
 
+        self.set_pmid(pmid)
+
+    def set_pmid(self, pmid):
+        """Points the popup at another PMID so a single instance can be reused."""
+        self.pmid = pmid
+        self.setWindowTitle(f"Action for PMID: {pmid}")
+        self.label.setText(f"What would you like to do with PMID: {pmid}?")
+
+
+class ElidedButton(QPushButton):
+    """
+    A push button that elides its text in the middle to fit the current width.
 
-class WordWrapButton(QPushButton):
+    The full text is kept and returned by text(); setText() also updates the tooltip.
+    Size hints are computed once per text from the full text, so re-eliding on
+    resize does not change them and trigger another layout pass.
+    """
     def __init__(self, text="", parent=None):
         super().__init__("", parent)
-        self.label = QLabel(text, self)
-        self.label.setWordWrap(True)
-        self.label.setAlignment(Qt.AlignCenter)
-        
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(self.label)
-        
+        self._elided_for = None  # (text, width) the displayed text was elided for
         self.setSizePolicy(QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum))
         self.setMinimumHeight(40)
+        self._set_full_text(text)
 
     def setText(self, text):
-        self.label.setText(text)
         self.setToolTip(text)
+        self._set_full_text(text)
 
     def text(self):
-        return self.label.text()
+        return self._full_text
 
     def sizeHint(self):
-        hint = self.label.sizeHint()
-        return hint
+        return self._size_hint
+
+    def minimumSizeHint(self):
+        # Allow shrinking below the width of the currently displayed text
+        return self._min_size_hint
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_elided_text()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.FontChange:
+            self._set_full_text(self._full_text)
+
+    def _set_full_text(self, text):
+        self._full_text = text
+        fm = self.fontMetrics()
+        self._size_hint = QSize(fm.horizontalAdvance(text) + 24, 40)
+        self._min_size_hint = QSize(fm.horizontalAdvance("...") + 12, 40)
+        self._elided_for = None
+        self.updateGeometry()
+        self._update_elided_text()
+
+    def _update_elided_text(self):
+        key = (self._full_text, self.width())
+        if key == self._elided_for:
+            return
+        self._elided_for = key
+        elided = self.fontMetrics().elidedText(self._full_text, Qt.ElideMiddle, max(1, self.width() - 12))
+        super().setText(elided)
 
 
 class QCWindow(QWidget):
@@ -269,7 +586,22 @@ class QCWindow(QWidget):
         self.setWindowTitle("QC View")
         self.setGeometry(150, 150, 960, 640)
         self.project_data = []
-        self.project_data_map = {}
+        self._names = []
+        self._db_ids = []
+        self._refs = []
+        self._event_rows = {}  # pathway index -> [(event name, event index)]
+        self._lit_cache = {}  # index -> formatted literature entries, built on first view
+        self._pmid_to_path = {}  # PMID -> path of its PDF in the dedicated folder
+        self._pdf_folder_key = None  # (folder, mtime_ns) _pmid_to_path was scanned at
+        self._action_popup = None  # Created on first use, then reused
+        self._pending_idx = None  # Latest item whose literature is waiting to be shown
+        self._shown_idx = None  # Item whose literature list2 currently shows
+        self._shown_event_rows = []  # Rows list_events currently shows
+        # Restarted on every selection change, so only the final one populates list2
+        self._populate_timer = QTimer(self)
+        self._populate_timer.setSingleShot(True)
+        self._populate_timer.setInterval(60)
+        self._populate_timer.timeout.connect(self._flush_populate)
         self.timer = QTimer(self)
         self.elapsed_time = 0
         self.is_critique_running = False
@@ -293,19 +625,15 @@ class QCWindow(QWidget):
 
         # Top-left: Pathway list
         self.list_pathways = QListWidget()
-        pathway_list_container = QWidget()
-        pathway_list_layout = QVBoxLayout(pathway_list_container)
-        pathway_list_layout.addWidget(QLabel("Pathways:"))
-        pathway_list_layout.addWidget(self.list_pathways)
-        left_splitter.addWidget(pathway_list_container)
+        left_splitter.addWidget(_titled("Pathways:", self.list_pathways))
 
         # Bottom-left: Literature list
-        bottom_left_container = QWidget()
-        bottom_left_layout = QVBoxLayout(bottom_left_container)
-        bottom_left_layout.addWidget(QLabel("Literature References:"))
-        self.list2 = QListWidget()
-        bottom_left_layout.addWidget(self.list2)
-        left_splitter.addWidget(bottom_left_container)
+        self.list2 = QListView()
+        self.list2.setUniformItemSizes(True)
+        self._lit_model = LitModel(self)
+        self.list2.setModel(self._lit_model)
+        self.list2.setItemDelegate(LitDelegate(self.list2, self._lit_model))
+        left_splitter.addWidget(_titled("Literature References:", self.list2))
 
         # --- Right Panel Layout ---
         right_layout = QVBoxLayout(right_panel)
@@ -314,11 +642,7 @@ class QCWindow(QWidget):
 
         # Top-right: Events list
         self.list_events = QListWidget()
-        event_list_container = QWidget()
-        event_list_layout = QVBoxLayout(event_list_container)
-        event_list_layout.addWidget(QLabel("Events in Pathway:"))
-        event_list_layout.addWidget(self.list_events)
-        right_splitter.addWidget(event_list_container)
+        right_splitter.addWidget(_titled("Events in Pathway:", self.list_events))
 
         # Bottom-right: AI critique button
         bottom_right_container = QWidget()
@@ -347,26 +671,41 @@ class QCWindow(QWidget):
         right_splitter.setSizes([424, 216])
 
         # --- Connect Signals ---
+        # A change of the current row repopulates the lists, so keyboard navigation
+        # works too. Clicking the current pathway again brings back its own
+        # literature after an event was viewed, which currentItemChanged misses.
+        self.list_pathways.currentItemChanged.connect(
+            lambda cur, prev: cur and self.on_pathway_list_item_clicked(cur))
         self.list_pathways.itemClicked.connect(self.on_pathway_list_item_clicked)
-        self.list_events.itemClicked.connect(self.on_event_list_item_clicked)
-        self.list2.itemClicked.connect(self.on_right_list_item_clicked)
+        self.list_events.currentItemChanged.connect(
+            lambda cur, prev: cur and self.on_event_list_item_clicked(cur))
+        # list2 opens a dialog, so it keeps reacting to every click
+        self.list2.clicked.connect(self.on_right_list_item_clicked)
 
     def set_debug_mode(self, enabled):
         self.debug_mode = enabled
 
-    def on_right_list_item_clicked(self, item):
+    def literature_items(self):
+        """Returns the display strings of the literature list, e.g. "✓ 12345678 ..."."""
+        return list(self._lit_model.texts())
+
+    def missing_pdf_pmids(self):
+        """Returns the PMIDs in the literature list that have no PDF in the PDF folder."""
+        return [pmid for pmid in self._lit_model.pmids()
+                if pmid is not None and pmid not in self._pmid_to_path]
+
+    def on_right_list_item_clicked(self, index):
         """
         Handles clicks on the right list to show a popup with options.
         """
-        item_text = item.text()
-        parts = item_text.split()
-
-        # The PMID should be the second part of the string, e.g., "✓ 12345678 ..."
-        if len(parts) > 1 and parts[1].isdigit():
-            pmid = parts[1]
-            
-            popup = ActionPopup(pmid, self)
-            result = popup.exec_()
+        # Message rows such as "No literature references found." carry no PMID
+        pmid = self._lit_model.pmid_at(index.row())
+        if pmid:
+            if self._action_popup is None:
+                self._action_popup = ActionPopup(pmid, self)
+            else:
+                self._action_popup.set_pmid(pmid)
+            result = self._action_popup.exec_()
 
             if result == 1: # Open PMID in browser
                 url = f"https://pubmed.ncbi.nlm.nih.gov/{pmid}"
@@ -392,119 +731,225 @@ class QCWindow(QWidget):
         Populates the left list with project data and stores it.
         """
         self.project_data = project_data
-        self.project_data_map = {str(item['DB_ID']): item for item in self.project_data}
-        
-        self.list_pathways.clear()
-        self.list_events.clear()
-        self.list2.clear()
-        
-        for item_data in self.project_data:
-            if item_data.get('type') == 'Pathway':
-                name = item_data.get('name', 'Unnamed Pathway')
-                db_id = item_data.get('DB_ID')
-                list_item = QListWidgetItem(name)
-                list_item.setData(Qt.UserRole, db_id) # Store DB_ID
-                self.list_pathways.addItem(list_item)
 
-    def _populate_literature_list(self, db_id):
+        # Split the per-item dicts into parallel per-field lists once, so the
+        # click handlers index plain lists instead of chaining dict lookups.
+        # List rows store an index into these lists in Qt.UserRole.
+        self._names = []
+        self._db_ids = []
+        self._refs = []
+        # Keyed by the DB_ID string as read from the XML, which is the form
+        # hasEvent references use; records without it fall back to str(DB_ID)
+        by_id = {}
+        pathway_indices = []
+        self._lit_cache.clear()
+        for idx, item_data in enumerate(project_data):
+            obj_type = item_data.get('type')
+            self._names.append(item_data.get('name'))
+            self._db_ids.append(item_data.get('DB_ID'))
+            self._refs.append(item_data.get('literature_references', []))
+            by_id[item_data.get('_db_id_str') or str(item_data.get('DB_ID'))] = idx
+            if obj_type == 'Pathway':
+                pathway_indices.append(idx)
+
+        # Event rows index into the lists above, so stale ones must go
+        _fill_list(self.list_events, [])
+        self._shown_event_rows = []
+        self._lit_model.set_rows([])
+        self._shown_idx = None
+        # A populate still pending would index the new lists with an old index
+        self._populate_timer.stop()
+        self._pending_idx = None
+
+        self.rescan_pdf_folder()
+
+        # Prebuild each pathway's event rows; hasEvent references may point
+        # forward, so this runs once by_id is complete.
+        pathways = []
+        self._event_rows = {}
+        for idx in pathway_indices:
+            pathways.append((self._names[idx] or 'Unnamed Pathway', idx))
+            event_rows = []
+            for event_id in project_data[idx].get('hasEvent_refs', []):
+                event_idx = by_id.get(event_id)
+                if event_idx is not None:
+                    event_rows.append((self._names[event_idx] or 'Unnamed Event', event_idx))
+            self._event_rows[idx] = event_rows
+
+        _fill_list(self.list_pathways, pathways)
+
+    def rescan_pdf_folder(self, force=False):
+        """
+        Rebuilds the cached PMID -> file path map of the dedicated PDF folder.
+
+        Unless forced, the scan is skipped if the folder's modification time
+        shows that no file has been added, removed or renamed since the last
+        one. Callers that know the folder changed force the scan, since a
+        coarse mtime may not have moved.
+        """
+        pdf_folder = config.get("dedicated_pdf_folder")
+        try:
+            folder_key = (pdf_folder, os.stat(pdf_folder).st_mtime_ns) if pdf_folder else None
+        except OSError:
+            folder_key = None
+        if not force and folder_key is not None and folder_key == self._pdf_folder_key:
+            return
+        self._pdf_folder_key = folder_key
+
+        pmid_to_path = {}
+        if folder_key is not None and os.path.isdir(pdf_folder):
+            with os.scandir(pdf_folder) as entries:
+                for entry in entries:
+                    m = PMID_FILE_RE.match(entry.name)
+                    # is_file() uses the type cached on the DirEntry where available
+                    if m and entry.is_file():
+                        pmid_to_path.setdefault(m.group(1), entry.path)
+        self._pmid_to_path = pmid_to_path
+
+    def mark_pdf_present(self, pmid, file_path):
+        """Records a PDF that was just associated with the given PMID."""
+        self._pmid_to_path[pmid] = file_path
+
+    def _populate_literature_list(self, idx):
         """
-        Populates the literature list (list2) for a given DB_ID.
+        Populates the literature list (list2) for the item at the given data index.
         """
-        self.list2.clear()
         self.ai_critique_button.setEnabled(False)
+        self._shown_idx = idx
+        # Picks up changes the file monitor missed; just a stat if there are none
+        self.rescan_pdf_folder()
 
-        data_item = self.project_data_map.get(str(db_id))
-        if not data_item:
+        if idx is None or not 0 <= idx < len(self._refs):
+            self._lit_model.set_rows([])
             return
 
         pdf_folder = config.get("dedicated_pdf_folder")
         if not pdf_folder or not os.path.isdir(pdf_folder):
-            self.list2.addItem("PDF folder not set or not found.")
+            self._lit_model.set_rows(["PDF folder not set or not found."])
+            return
+
+        entries = self._lit_cache.get(idx)
+        if entries is None:
+            entries = self._lit_cache[idx] = self._format_literature(self._refs[idx])
+
+        if not entries:
+            self._lit_model.set_rows(["No literature references found."])
             return
 
+        texts = []
+        pmids = []
+        row_columns = []
         all_files_found = True
-        literature_references = data_item.get('literature_references', [])
-        if not literature_references:
-            self.list2.addItem("No literature references found.")
-            all_files_found = False
-        else:
-            for ref in literature_references:
-                pmid = ref[0] if len(ref) > 0 else None
-                title = ref[1] if len(ref) > 1 else 'No Title'
-                year = ref[2] if len(ref) > 2 and ref[2] else 'N/A'
-                authors = ref[3] if len(ref) > 3 and ref[3] else []
-                surname = authors[0] if authors else 'N/A'
-
-                if not pmid:
-                    self.list2.addItem(f"❌ (No PMID) {title}")
-                    all_files_found = False
-                    continue
-
-                file_exists = False
-                for filename in os.listdir(pdf_folder):
-                    if filename.startswith(f"PMID:{pmid}"):
-                        file_exists = True
-                        break
-                
-                if not file_exists:
-                    all_files_found = False
-
-                check_mark = "✓" if file_exists else "❌"
-                self.list2.addItem(f"{check_mark} {pmid} {surname} ({year}): {title}")
-        
+        # Only the check mark depends on the PDF folder, so just it is added here
+        for pmid, text, columns in entries:
+            if pmid is None:
+                texts.append(f"❌ {text}")
+                pmids.append(None)
+                row_columns.append(None)
+                all_files_found = False
+                continue
+
+            file_exists = pmid in self._pmid_to_path
+            if not file_exists:
+                all_files_found = False
+
+            check_mark = "✓" if file_exists else "❌"
+            texts.append(f"{check_mark} {text}")
+            pmids.append(pmid)
+            row_columns.append((check_mark,) + columns)
+
+        self._lit_model.set_rows(texts, pmids, row_columns)
+
         # The button should only be enabled if there are references and all files are found.
         if not self.is_critique_running:
-            self.ai_critique_button.setEnabled(all_files_found and bool(literature_references))
+            self.ai_critique_button.setEnabled(all_files_found)
 
-    def on_pathway_list_item_clicked(self, item):
+    @staticmethod
+    def _format_literature(literature_references):
         """
-        Handles clicks on the pathway list to populate the events list and its own literature.
+        Formats literature references into (pmid, text, columns) entries without the
+        check mark. pmid is None for references without a PMID; otherwise columns is
+        (pmid, surname, year, title) for LitDelegate.
+        """
+        entries = []
+        # The parser always stores references as [pmid, title, year, surnames]
+        for pmid, title, year, authors in literature_references:
+            title = title or 'No Title'
+            year = year or 'N/A'
+            surname = authors[0] if authors else 'N/A'
+
+            if not pmid:
+                entries.append((None, f"(No PMID) {title}", None))
+            else:
+                entries.append((pmid, f"{pmid} {surname} ({year}): {title}", (pmid, surname, year, title)))
+        return entries
+
+    def _schedule_literature_populate(self, idx, force=False):
+        """
+        Debounces selection changes so only the latest one populates list2.
+        Reselecting the item list2 already shows does nothing unless forced.
         """
-        pathway_db_id = str(item.data(Qt.UserRole))
-        pathway_data = self.project_data_map.get(pathway_db_id)
+        if not force and idx == self._shown_idx and not self._populate_timer.isActive():
+            return
+        self._pending_idx = idx
+        # The shown references are stale until the flush runs
+        self.ai_critique_button.setEnabled(False)
+        self._populate_timer.start()
 
-        self.list_events.clear()
+    def _flush_populate(self):
+        self._populate_literature_list(self._pending_idx)
 
-        if not pathway_data:
-            self.list2.clear()
-            self.ai_critique_button.setEnabled(False)
-            return
+    def on_pathway_list_item_clicked(self, item):
+        """
+        Handles clicks on the pathway list to populate the events list and its own literature.
+        """
+        pathway_idx = item.data(Qt.UserRole)
+
+        event_rows = self._event_rows.get(pathway_idx, [])
+        if event_rows == self._shown_event_rows:
+            # Same events already listed; only drop the previous event selection
+            with _batch_update(self.list_events):
+                self.list_events.clearSelection()
+                self.list_events.setCurrentRow(-1)
+        else:
+            _fill_list(self.list_events, event_rows)
+            self._shown_event_rows = event_rows
 
-        # Populate events list
-        event_refs = pathway_data.get('hasEvent_refs', [])
-        for event_id in event_refs:
-            event_data = self.project_data_map.get(event_id)
-            if event_data:
-                name = event_data.get('name', 'Unnamed Event')
-                db_id = event_data.get('DB_ID')
-                list_item = QListWidgetItem(name)
-                list_item.setData(Qt.UserRole, db_id)
-                self.list_events.addItem(list_item)
-        
         # Populate literature list for the pathway itself
-        self._populate_literature_list(pathway_db_id)
+        self._schedule_literature_populate(pathway_idx)
 
     def on_event_list_item_clicked(self, item):
         """
         Handles clicks on the events list to populate the literature reference list.
         """
-        clicked_item_db_id = item.data(Qt.UserRole)
-        if clicked_item_db_id is None:
+        event_idx = item.data(Qt.UserRole)
+        if event_idx is None:
             return
-        self._populate_literature_list(clicked_item_db_id)
+        self._schedule_literature_populate(event_idx)
+
+    def selected_db_id(self):
+        """
+        Returns the DB_ID of the selected event, or of the selected pathway if no
+        event is selected, or None if nothing is selected.
+        """
+        for list_widget in (self.list_events, self.list_pathways):
+            selected_items = list_widget.selectedItems()
+            if selected_items:
+                return self._db_ids[selected_items[0].data(Qt.UserRole)]
+        return None
 
     def refresh_selected_item(self):
         """
-        Refreshes the right list based on the currently selected item in the left list.
+        Refreshes the right list based on the currently selected item in the left list,
+        even if it already shows that item, e.g. after PDFs or the critique state changed.
         """
-        selected_items = self.list_events.selectedItems()
-        if selected_items:
-            self.on_event_list_item_clicked(selected_items[0])
-        else:
-            # If no event is selected, maybe refresh based on pathway
-            selected_pathways = self.list_pathways.selectedItems()
-            if selected_pathways:
-                self.on_pathway_list_item_clicked(selected_pathways[0])
+        for list_widget in (self.list_events, self.list_pathways):
+            selected_items = list_widget.selectedItems()
+            if selected_items:
+                idx = selected_items[0].data(Qt.UserRole)
+                if idx is not None:
+                    self._schedule_literature_populate(idx, force=True)
+                return
 
 
 
@@ -520,6 +965,11 @@ class MainAppWindow(QMainWindow):
         self.debug_mode = False
 
         self.qc_window = None # To hold a reference to the QC window
+        self._last_sorted_key = None  # (path, mtime_ns, size) of the data shown in qc_window
+        self._project_cache = OrderedDict()  # (path, mtime_ns, size) -> sorted project data
+        self._loader_thread = None
+        self._loader = None
+        self._refresh_pending = None  # Project file to reload once the running load is done
 
         # --- Main Layout ---
         self.central_widget = QWidget()
@@ -547,10 +997,14 @@ class MainAppWindow(QMainWindow):
         self.splitter.setSizes([300, 700]) # Initial size ratio
 
         # --- UI Elements (Left Panel) ---
+        # Snapshot the configured paths once; each is used for text and tooltip
+        vals = {k: config.get(k, _NOT_SET)
+                for k in ("downloads_folder", "dedicated_pdf_folder", "project_file_path")}
+
         # Downloads Folder
         self.downloads_label = QLabel("downloads_folder")
-        self.downloads_button = WordWrapButton(config.get("downloads_folder", "Not Set"))
-        self.downloads_button.setToolTip(config.get("downloads_folder", "Not Set"))
+        self.downloads_button = ElidedButton(vals["downloads_folder"])
+        self.downloads_button.setToolTip(vals["downloads_folder"])
 
         # File Operation Radio Buttons
         self.file_op_label = QLabel("File Operation:")
@@ -565,40 +1019,61 @@ class MainAppWindow(QMainWindow):
         else:
             self.move_radio.setChecked(True)
 
+        self._radio_to_str = {self.copy_radio: "Copy", self.move_radio: "Move"}
         self.file_op_group.buttonClicked.connect(self.on_file_op_changed)
 
+        # Coalesces rapid setting changes into a single config file write
+        self._config_save_timer = QTimer(self)
+        self._config_save_timer.setSingleShot(True)
+        self._config_save_timer.setInterval(300)
+        self._config_save_timer.timeout.connect(self._save_config)
+
         # Dedicated PDF Folder
         self.pdf_folder_label = QLabel("dedicated_pdf_folder")
-        self.pdf_folder_button = WordWrapButton(config.get("dedicated_pdf_folder", "Not Set"))
-        self.pdf_folder_button.setToolTip(config.get("dedicated_pdf_folder", "Not Set"))
+        self.pdf_folder_button = ElidedButton(vals["dedicated_pdf_folder"])
+        self.pdf_folder_button.setToolTip(vals["dedicated_pdf_folder"])
 
         # Project File
         self.project_file_label = QLabel("project_file")
-        self.project_file_button = WordWrapButton(config.get("project_file_path", "Not Set"))
-        self.project_file_button.setToolTip(config.get("project_file_path", "Not Set"))
+        self.project_file_button = ElidedButton(vals["project_file_path"])
+        self.project_file_button.setToolTip(vals["project_file_path"])
 
         # Gemini API Key
         self.gemini_api_key_label = QLabel("GEMINI_API_KEY")
-        self.gemini_api_key_button = WordWrapButton("Edit")
+        self.gemini_api_key_button = ElidedButton("Edit")
         self.gemini_api_key_button.setToolTip("GEMINI_API_KEY")
         self.gemini_api_key_button.clicked.connect(self.on_gemini_api_key_clicked)
 
         # Critique Model
         self.critique_model_label = QLabel("critique_model")
-        self.critique_model_button = WordWrapButton(config.get("critique_model", "gemini-2.5-pro"))
+        self.critique_model_button = ElidedButton(config.get("critique_model", "gemini-2.5-pro"))
         self.critique_model_button.setToolTip("Gemini model used for AI critique")
         self.critique_model_button.clicked.connect(self.on_critique_model_clicked)
 
         # Critique Prompt
         self.critique_prompt_label = QLabel("critique_prompt")
-        self.critique_prompt_button = WordWrapButton("Edit Prompt...")
+        self.critique_prompt_button = ElidedButton("Edit Prompt...")
         self.critique_prompt_button.setToolTip("Edit the prompt used for AI critique")
         self.critique_prompt_button.clicked.connect(self.on_critique_prompt_clicked)
 
         # --- UI Elements (Right Panel) ---
         self.status_label = QLabel("Status Log:")
-        self.status_display = QTextEdit()
-        self.status_display.setReadOnly(True)
+        try:
+            log_max_lines = int(config.get("log_max_lines", 1000))
+        except (TypeError, ValueError):
+            log_max_lines = 1000
+        # 0 (or less) keeps every message
+        self._log_model = LogListModel(log_max_lines if log_max_lines > 0 else None, self)
+        self.status_display = QListView()
+        self.status_display.setModel(self._log_model)
+        self.status_display.setUniformItemSizes(True)
+        self.status_display.setLayoutMode(QListView.Batched)
+        self.status_display.setSelectionMode(QListView.ExtendedSelection)
+        self._log_buf = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(50)
+        self._log_flush_timer.timeout.connect(self._flush_status)
         self.start_qc_button = QPushButton("Open QC window")
         self.start_qc_button.setFixedHeight(40)
         self.start_qc_button.clicked.connect(self.open_qc_window)
@@ -657,44 +1132,160 @@ class MainAppWindow(QMainWindow):
             return
 
         try:
-            with open(project_file_path, 'r', encoding='utf-8') as f:
-                xml_content = f.read()
+            stat = os.stat(project_file_path)
         except FileNotFoundError:
             self.show_warning_message("Project File Error", f"Project file not found at: {project_file_path}")
             return
-        except Exception as e:
+        except OSError as e:
             self.show_warning_message("File Read Error", f"Could not read project file: {e}")
             return
 
-        event_data = extract_event_data(xml_content)
+        # Reopening an unchanged project: the window already holds the sorted data
+        cache_key = (project_file_path, stat.st_mtime_ns, stat.st_size)
+        if self.qc_window is not None and cache_key == self._last_sorted_key:
+            self.qc_window.show()
+            self.qc_window.raise_()
+            self.update_status_display(
+                f"QC Window opened. Project unchanged, {len(self.qc_window.project_data)} items already loaded.")
+            return
+
+        # A recently loaded project file that is still unchanged needs no reload
+        if cache_key in self._project_cache:
+            self._project_cache.move_to_end(cache_key)
+            self._show_project_data(project_file_path, cache_key, self._project_cache[cache_key])
+            return
+
+        if self._loader_thread is not None:
+            # A load is already in progress; its result will open the window
+            return
+
+        self._start_project_load(project_file_path, cache_key)
+
+    def refresh_qc_window(self, project_file_path):
+        """
+        Reloads the QC window from a changed project file on the loader thread.
+        """
+        try:
+            stat = os.stat(project_file_path)
+        except OSError as e:
+            self.update_status_display(f"Could not refresh QC view: {e}")
+            return
+
+        cache_key = (project_file_path, stat.st_mtime_ns, stat.st_size)
+        if cache_key == self._last_sorted_key:
+            return
+        if self._loader_thread is not None:
+            # Reload again once the running load is done, as it may have read the old file
+            self._refresh_pending = project_file_path
+            return
 
-        if not event_data:
-            self.show_warning_message("Data Extraction Error", "No data could be extracted from the project file.")
+        self.update_status_display("Project file changed. Refreshing QC view.")
+        self._start_project_load(project_file_path, cache_key, refresh=True)
+
+    def _start_project_load(self, project_file_path, cache_key, refresh=False):
+        """Reads, parses and sorts the project file on a worker thread."""
+        self._loader_thread = QThread()
+        self._loader = ProjectLoader(project_file_path, cache_key, refresh)
+        self._loader.moveToThread(self._loader_thread)
+
+        self._loader_thread.started.connect(self._loader.run)
+        self._loader.loaded.connect(self._on_project_loaded)
+        self._loader.failed.connect(self._on_project_load_failed)
+
+        self.start_qc_button.setEnabled(False)
+        self.update_status_display(f"Loading project file {os.path.basename(project_file_path)}...")
+        self._loader_thread.start()
+
+    def _cache_project_data(self, cache_key, sorted_project_data):
+        """Remembers the sorted data of the two most recently loaded project files."""
+        self._project_cache[cache_key] = sorted_project_data
+        self._project_cache.move_to_end(cache_key)
+        while len(self._project_cache) > 2:
+            self._project_cache.popitem(last=False)
+
+    def _finish_project_load(self):
+        """Stops the project loader thread and returns the finished loader."""
+        loader = self._loader
+        self._loader_thread.quit()
+        self._loader_thread.wait()
+        self._loader_thread = None
+        self._loader = None
+        self.start_qc_button.setEnabled(True)
+        if self._refresh_pending is not None:
+            project_file_path, self._refresh_pending = self._refresh_pending, None
+            QTimer.singleShot(0, lambda: self.refresh_qc_window(project_file_path))
+        return loader
+
+    def _on_project_load_failed(self, title, message):
+        """Handles a project file that could not be read by the loader."""
+        self._finish_project_load()
+        self.show_warning_message(title, message)
+
+    def _on_project_loaded(self, sorted_project_data):
+        """
+        Shows the QC window with the sorted project data delivered by the loader.
+        """
+        loader = self._finish_project_load()
+
+        if not sorted_project_data:
+            if loader.refresh and self.qc_window is not None:
+                self.qc_window.update_data([])  # Clear lists
+                self._last_sorted_key = loader.cache_key
+                self.update_status_display("No data could be extracted from project file, QC view cleared.")
+            else:
+                self.show_warning_message("Data Extraction Error", "No data could be extracted from the project file.")
             return
 
+        self._cache_project_data(loader.cache_key, sorted_project_data)
+        self._show_project_data(loader.project_file_path, loader.cache_key, sorted_project_data,
+                                refresh=loader.refresh)
+
+    def _show_project_data(self, project_file_path, cache_key, sorted_project_data, refresh=False):
+        """
+        Shows the QC window with the given sorted project data, creating the window if needed.
+        """
         if self.qc_window is None:
             self.qc_window = QCWindow()
             if self.controller:
                 self.qc_window.pmid_hint_set.connect(self.controller.set_pmid_hint)
                 self.qc_window.pdf_association_requested.connect(self.controller.on_pdf_association_requested)
                 self.qc_window.pmc_download_requested.connect(self.controller.on_pmc_download_requested)
+                # Queued so the click returns to the event loop before the critique starts
                 self.qc_window.ai_critique_button.clicked.connect(
-                    self.controller.on_ai_critique_clicked)
+                    self.controller.on_ai_critique_clicked, Qt.QueuedConnection)
                 self.qc_window.timer.timeout.connect(self.controller.update_timer)
 
         project_file_name = os.path.basename(project_file_path)
         self.qc_window.setWindowTitle(f"QC: {project_file_name}")
 
-        # Sort the data alphabetically by name (case-insensitive)
-        sorted_project_data = sorted(event_data, key=lambda x: x.get('name', 'Unnamed').lower())
-        
         self.qc_window.update_data(sorted_project_data)
+        self._last_sorted_key = cache_key
 
+        if refresh:
+            self.update_status_display(f"QC Window updated. Loaded {len(sorted_project_data)} items.")
+            return
         self.qc_window.show()
-        self.update_status_display(f"QC Window opened. Loaded {len(event_data)} items.")
+        self.update_status_display(f"QC Window opened. Loaded {len(sorted_project_data)} items.")
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._log_buf:
+            self._log_flush_timer.start()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        # Write the messages held back while the window was minimized
+        if event.type() == QEvent.WindowStateChange and not self.isMinimized() and self._log_buf:
+            self._log_flush_timer.start()
 
     def closeEvent(self, event):
-        """Ensures the QC window is closed when the main window is closed."""
+        """Flushes a pending config write and closes the QC window along with the main window."""
+        if self._config_save_timer.isActive():
+            self._config_save_timer.stop()
+            self._save_config()
+        if self._loader_thread is not None:
+            self._loader_thread.quit()
+            self._loader_thread.wait()
         if self.qc_window:
             self.qc_window.close()
         super().closeEvent(event)
@@ -703,6 +1294,13 @@ class MainAppWindow(QMainWindow):
         """Displays a warning message box."""
         QMessageBox.warning(self, title, message)
 
+    def schedule_config_save(self):
+        """
+        Writes the config to disk shortly after the last change, so a burst of
+        changes results in a single write. A pending write is flushed on close.
+        """
+        self._config_save_timer.start()
+
     def _save_config(self):
         if not save_config(config):
             self.show_warning_message(
@@ -719,7 +1317,7 @@ class MainAppWindow(QMainWindow):
                                            current_key)
         if ok and new_key != current_key:
             config["GEMINI_API_KEY"] = new_key
-            self._save_config()
+            self.schedule_config_save()
             self.update_status_display("GEMINI_API_KEY updated.")
 
     def on_critique_model_clicked(self):
@@ -731,7 +1329,7 @@ class MainAppWindow(QMainWindow):
                                              current_model)
         if ok and new_model != current_model:
             config["critique_model"] = new_model
-            self._save_config()
+            self.schedule_config_save()
             self.critique_model_button.setText(new_model)
             self.update_status_display(f"critique_model updated to: {new_model}")
 
@@ -743,38 +1341,95 @@ class MainAppWindow(QMainWindow):
             new_prompt = dialog.get_prompt()
             if new_prompt != current_prompt:
                 config["critique_prompt"] = new_prompt
-                self._save_config()
+                self.schedule_config_save()
                 self.update_status_display("critique_prompt updated.")
 
     def on_file_op_changed(self, button):
         """Handles the change in file operation radio buttons."""
-        config["file_operation"] = button.text()
-        self._save_config()
-        self.update_status_display(f"File operation set to {button.text()}")
+        op = self._radio_to_str[button]
+        # buttonClicked also fires when the checked button is clicked again
+        if op == config.get("file_operation"):
+            return
+        config["file_operation"] = op
+        self.schedule_config_save()
+        self.update_status_display(f"File operation set to {op}")
 
-    def update_status_display(self, message):
+    def update_status_display(self, message, level=logging.INFO):
         """Updates the status bar and the main status log display."""
+        self.add_log_records([(message, level)])
+
+    def add_log_records(self, records):
+        """
+        Shows (message, level number) pairs in the status log; the status bar
+        shows the last one.
+        """
         # Filter out DEBUG messages if not in debug mode
-        if " - DEBUG - " in message and not self.debug_mode:
+        if not self.debug_mode:
+            records = [record for record in records if record[1] > logging.DEBUG]
+        if not records:
             return
+        # Status bar and log are updated in batches, see _flush_status
+        for msg, _ in records:
+            # Log rows share one height, so multi-line messages are flattened
+            if "\n" in msg:
+                msg = " ".join(msg.splitlines())
+            if len(msg) > _STATUS_LOG_MAX_CHARS:
+                msg = (f"{msg[:_STATUS_LOG_MAX_CHARS]}... "
+                       f"[+{len(msg) - _STATUS_LOG_MAX_CHARS} chars truncated]")
+            self._log_buf.append(msg)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_status(self):
+        """
+        Appends all buffered messages to the status log in one edit and shows
+        the last of them in the status bar.
+        """
+        if not self._log_buf:
+            return
+        message = self._log_buf[-1]
+        if len(message) > _STATUS_BAR_MAX_CHARS:
+            message = message[:_STATUS_BAR_MAX_CHARS - 3] + "..."
         self.status_bar.showMessage(message)
-        self.status_display.append(message)
-        # Automatically scroll to the bottom
-        self.status_display.verticalScrollBar().setValue(self.status_display.verticalScrollBar().maximum())
+        if self.isMinimized() or not self.status_display.isVisible():
+            # Nothing would be painted; keep buffering until the log is shown again,
+            # but never more lines than the log itself would keep
+            max_lines = self._log_model.max_lines()
+            if max_lines is not None:
+                del self._log_buf[:-max_lines]
+            return
+        # Follow new messages only if the view was already at the bottom
+        scroll_bar = self.status_display.verticalScrollBar()
+        at_bottom = scroll_bar.value() == scroll_bar.maximum()
+        # Rows dropped, rows inserted and the scroll are painted once
+        self.status_display.setUpdatesEnabled(False)
+        try:
+            self._log_model.append_lines(self._log_buf)
+            self._log_buf.clear()
+            if at_bottom:
+                self.status_display.scrollToBottom()
+        finally:
+            self.status_display.setUpdatesEnabled(True)
+            self.status_display.viewport().update()
 
     def prompt_for_pmid(self):
         """
-        Creates a dialog to prompt the user for a PMID.
-        (This is a placeholder for a more complex dialog)
+        Prompts the user for a PMID in a modal dialog.
+        Returns the entered PMID, or None if the dialog was cancelled or left empty.
         """
-        # In a real app, this would be a QInputDialog or a custom QDialog.
-        print("UI: Prompting for PMID...")
-        # This would need to return the entered value.
-        pass
+        pmid, ok = QInputDialog.getText(self, "Enter PMID", "PMID:")
+        pmid = pmid.strip()
+        return pmid if ok and pmid else None
 
-if __name__ == '__main__':
-    # Example of how to run the UI directly for testing
-    app = QApplication(sys.argv)
+def _run_gui():
+    """
+    Example of how to run the UI directly for testing; reuses a running
+    QApplication and skips Qt's command line parsing, which is not needed here.
+    """
+    app = QApplication.instance() or QApplication([])
     main_window = MainAppWindow()
     main_window.show()
     sys.exit(app.exec_())
+
+if __name__ == '__main__':
+    _run_gui()